@@ -3,8 +3,8 @@
 Categorize medical AI papers based on topics field from search_arxiv_medical.py
 Reads relative_papers.json and outputs categorized_papers.json
 """
-import json
 import os
+import sys
 from datetime import datetime
 from utils import load_json, save_json
 
@@ -78,22 +78,26 @@ def categorize_papers(input_file: str = 'relative_papers.json', output_file: str
             'date_range': date_range
         }
         metadata_file = os.path.join(output_dir, 'metadata.json')
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        save_json(metadata_file, metadata)
         print(f"Metadata saved to: {metadata_file}")
 
-    # Print summary
-    print(f"Categorization complete:")
-    for topic, topic_papers in papers_by_topic.items():
-        print(f"  {topic}: {len(topic_papers)} papers")
-    print(f"Results saved to: {output_file}")
+    # Print summary in a single write
+    sys.stdout.write(
+        'Categorization complete:\n'
+        + ''.join(f"  {topic}: {len(topic_papers)} papers\n" for topic, topic_papers in papers_by_topic.items())
+        + f"Results saved to: {output_file}\n"
+    )
 
     return output_data
 
 
-if __name__ == '__main__':
+def main():
     output_dir = os.getenv('OUTPUT_DIR', '.')
     os.makedirs(output_dir, exist_ok=True)
     input_file = os.path.join(output_dir, 'relative_papers.json')
     output_file = os.path.join(output_dir, 'papers_data.json')
     categorize_papers(input_file, output_file)
+
+
+if __name__ == '__main__':
+    main()
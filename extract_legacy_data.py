@@ -8,6 +8,7 @@ import re
 import os
 from pathlib import Path
 from datetime import datetime
+from utils import iter_day_dirs, iter_year_dirs, save_json
 
 def extract_papers_from_html(html_content):
     """Extract paper data from old index.html format."""
@@ -150,25 +151,19 @@ def create_papers_data_for_date(date_dir):
     }
 
     # Save
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+    save_json(output_file, output_data)
 
     print(f"Created {output_file}: {len(papers)} papers, {len(topics)} topics")
     return True
 
 
 def main():
-    docs_dir = Path('docs')
-
-    # Find all date directories
-    date_dirs = []
-    for year_dir in docs_dir.glob('2*'):  # Year directories like 2026
-        if year_dir.is_dir():
-            for month_dir in year_dir.glob('*'):
-                if month_dir.is_dir():
-                    for day_dir in month_dir.glob('*'):
-                        if day_dir.is_dir():
-                            date_dirs.append(day_dir)
+    # Find all date directories (same walk as the index page)
+    date_dirs = [
+        Path(day_entry.path)
+        for year_entry in iter_year_dirs('docs')
+        for _, day_entry in iter_day_dirs(year_entry)
+    ]
 
     print(f"Found {len(date_dirs)} date directories")
     print()
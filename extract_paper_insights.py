@@ -4,16 +4,18 @@ Extract keywords, Chinese summary, and translated abstract from paper using LLM.
 Updates relative_papers.json in-place.
 """
 import arxiv
+import asyncio
 import json
 import os
-from llm import get_llm_client
+from llm import clean_markdown_code_blocks, create_json_completion_async, get_async_llm_client
 from prompts import EXTRACT_PAPER_INSIGHTS
-from utils import load_json, save_json
+from utils import arxiv_session, load_json, save_json
 
-INPUT_FILE = os.path.join(os.getenv('OUTPUT_DIR', '.'), 'relative_papers.json')
+# Max in-flight LLM requests, shared with the search step's filter
+LLM_CONCURRENCY = int(os.getenv('LLM_CONCURRENCY', 16))
 
 
-def extract_insights(client, title, abstract, max_retries=2):
+async def extract_insights(client, semaphore, title, abstract, max_retries=2):
     """Extract keywords, Chinese summary, and translated abstract using LLM"""
     if not client:
         return None, None, None
@@ -22,17 +24,19 @@ def extract_insights(client, title, abstract, max_retries=2):
 
     for attempt in range(max_retries):
         try:
-            response = client.chat.completions.create(
-                model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
-                messages=[{'role': 'user', 'content': prompt}],
-                temperature=0.3
-            )
+            async with semaphore:
+                response = await create_json_completion_async(
+                    client,
+                    model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
+                    messages=[{'role': 'user', 'content': prompt}],
+                    temperature=0.3
+                )
 
             if not response.choices:
                 raise ValueError("Empty response choices")
 
             content = response.choices[0].message.content
-            data = json.loads(content)
+            data = json.loads(clean_markdown_code_blocks(content))
             return (
                 data.get('keywords'),
                 data.get('summary'),
@@ -48,8 +52,66 @@ def extract_insights(client, title, abstract, max_retries=2):
     return None, None, None
 
 
+def fetch_abstracts(arxiv_ids):
+    """Fetch full arXiv metadata for the given papers in one id_list query
+
+    Returns: dict of arxiv_id (without version) -> arxiv.Result
+    """
+    if not arxiv_ids:
+        return {}
+    search = arxiv.Search(id_list=arxiv_ids, max_results=len(arxiv_ids))
+    # One page for the whole id list (arXiv allows up to 2000 per call)
+    with arxiv_session(page_size=min(len(arxiv_ids), 2000)) as client:
+        return {result.get_short_id().split('v')[0]: result for result in client.results(search)}
+
+
+async def extract_all(papers, results):
+    """Run insight extraction for every fetched paper concurrently, bounded by LLM_CONCURRENCY"""
+    llm_client = get_async_llm_client()
+    semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+
+    async def extract_one(i, p):
+        arxiv_id = p['arxiv_id'].split('v')[0]
+
+        # Already extracted by the search step (LLM_COMBINED_EXTRACT)
+        if p.get('llm_summary') and p.get('abstract_cn'):
+            print(f"[SKIP] ({i+1}/{len(papers)}) {arxiv_id}: already extracted")
+            return True
+
+        # The search step stores the full abstract; only older inputs need the arXiv lookup
+        if p.get('abstract'):
+            title, abstract = p.get('title', ''), p['abstract']
+        else:
+            result = results.get(arxiv_id)
+            if result is None:
+                print(f"[ERR] {arxiv_id}: not returned by arXiv")
+                return False
+            title, abstract = result.title, result.summary
+
+        # Extract keywords, summary, and translated abstract
+        llm_keywords, llm_summary, abstract_cn = await extract_insights(
+            llm_client, semaphore, title, abstract
+        )
+
+        # Update paper in-place
+        p['abstract'] = abstract
+        p['llm_keywords'] = llm_keywords
+        p['llm_summary'] = llm_summary
+        p['abstract_cn'] = abstract_cn
+
+        print(f"[OK] ({i+1}/{len(papers)}) {arxiv_id}")
+        return True
+
+    tasks = (extract_one(i, p) for i, p in enumerate(papers))
+    if not llm_client:
+        return sum(await asyncio.gather(*tasks))
+    async with llm_client:
+        return sum(await asyncio.gather(*tasks))
+
+
 def main():
-    input_data = load_json(INPUT_FILE, {})
+    input_file = os.path.join(os.getenv('OUTPUT_DIR', '.'), 'relative_papers.json')
+    input_data = load_json(input_file, {})
 
     # Handle both old format (list) and new format (dict with 'papers' key)
     if isinstance(input_data, list):
@@ -57,36 +119,15 @@ def main():
     else:
         papers = input_data.get('papers', [])
 
-    client = arxiv.Client()
-    llm_client = get_llm_client()
-
     print(f"Processing {len(papers)} papers...")
 
-    updated_count = 0
+    try:
+        results = fetch_abstracts([p['arxiv_id'].split('v')[0] for p in papers if not p.get('abstract')])
+    except Exception as e:
+        print(f"[ERR] Failed to fetch paper metadata: {e}")
+        results = {}
 
-    for i, p in enumerate(papers):
-        arxiv_id = p['arxiv_id'].split('v')[0]
-
-        try:
-            search = arxiv.Search(id_list=[arxiv_id])
-            result = next(client.results(search))
-
-            # Extract keywords, summary, and translated abstract
-            llm_keywords, llm_summary, abstract_cn = extract_insights(
-                llm_client, result.title, result.summary
-            )
-
-            # Update paper in-place
-            p['abstract'] = result.summary
-            p['llm_keywords'] = llm_keywords
-            p['llm_summary'] = llm_summary
-            p['abstract_cn'] = abstract_cn
-
-            updated_count += 1
-            print(f"[OK] ({i+1}/{len(papers)}) {arxiv_id}")
-
-        except Exception as e:
-            print(f"[ERR] {arxiv_id}: {e}")
+    updated_count = asyncio.run(extract_all(papers, results))
 
     # Preserve date_range from original input if it exists
     output_data = papers if isinstance(input_data, list) else {
@@ -94,7 +135,7 @@ def main():
         'date_range': input_data.get('date_range', {})
     }
 
-    save_json(INPUT_FILE, output_data)
+    save_json(input_file, output_data)
 
     print(f"\n=== Summary ===")
     print(f"Updated: {updated_count}/{len(papers)} papers")
@@ -6,17 +6,10 @@ Usage: report.html?date=2026-03-27
 """
 import os
 import sys
+import json
 import hashlib
 from dotenv import load_dotenv
 
-load_dotenv()
-
-OUTPUT_DIR = sys.argv[1] if len(sys.argv) > 1 else os.getenv('OUTPUT_DIR', 'docs')
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-TOPICS_RAW = os.getenv('TOPICS', '')
-TOPICS = [t.strip() for t in TOPICS_RAW.split(',') if t.strip()]
-
 TOPIC_COLORS = {
     '医疗大模型': '#1e40af',
     '医疗数据集': '#047857',
@@ -25,16 +18,14 @@ TOPIC_COLORS = {
     '临床决策支持': '#be123c',
 }
 
+# Fallback palette for topics without a fixed color
+TOPIC_PALETTE = ('#1e40af', '#047857', '#7c3aed', '#0369a1', '#be123c', '#b45309', '#4338ca')
+
 def get_topic_color(topic):
     if topic in TOPIC_COLORS:
         return TOPIC_COLORS[topic]
     hash_val = int(hashlib.md5(topic.encode()).hexdigest()[:8], 16)
-    colors = ['#1e40af', '#047857', '#7c3aed', '#0369a1', '#be123c', '#b45309', '#4338ca']
-    return colors[hash_val % len(colors)]
-
-# Build topic colors JS
-js_colors = 'const TOPIC_COLORS = {};\n'
-js_colors += ''.join(f"TOPIC_COLORS['{topic}'] = '{get_topic_color(topic)}';\n" for topic in TOPICS)
+    return TOPIC_PALETTE[hash_val % len(TOPIC_PALETTE)]
 
 # CSS styles
 css = """
@@ -69,7 +60,6 @@ body { font-family: system-ui, -apple-system, sans-serif; background: var(--bg);
 .paper-actions { margin-top: 12px; }
 .btn-primary { background: var(--accent); color: white; }
 .btn-secondary { background: white; border: 1px solid var(--border); color: var(--text); }
-.hidden { display: none !important; }
 .section-header { border: 1px solid var(--border); border-left-width: 4px; border-left-color: var(--accent); padding: 12px; margin-top: 24px; margin-bottom: 12px; background: #fff; border-radius: 0 8px 8px 0; display: flex; align-items: center; gap: 10px; }
 .section-title { font-weight: 700; font-size: 18px; }
 .section-count { margin-left: auto; color: var(--muted); }
@@ -80,7 +70,9 @@ body { font-family: system-ui, -apple-system, sans-serif; background: var(--bg);
 
 # JavaScript - now with URL parameter support
 js = """
-let data = null, filter = 'all';
+let data = null;
+// Stat items cached after each render so filter clicks don't rescan the DOM
+let statItems = [];
 
 function getReportDate() {
     const params = new URLSearchParams(window.location.search);
@@ -127,13 +119,19 @@ async function loadData() {
     }
 }
 
+const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+
+function esc(s) {
+    return String(s).replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
+}
+
 function formatAuthors(authors) {
     if (!authors || authors.length === 0) return '<span class="author">未知作者</span>';
     const list = authors.slice(0, 6).map(a => {
         let n = typeof a === 'object' ? a.name : String(a);
         const p = n.split(' ');
         if (p.length > 1) n = p[p.length-1] + ' ' + p.slice(0,-1).map(x=>x[0]).join('');
-        return '<span class="author">' + n + '</span>';
+        return '<span class="author">' + esc(n) + '</span>';
     });
     if (authors.length > 6) list.push('<span class="author">等</span>');
     return list.join(', ');
@@ -142,26 +140,30 @@ function formatAuthors(authors) {
 function formatKeywords(kw) {
     if (!kw) return '';
     const arr = typeof kw === 'string' ? kw.split(',').map(x=>x.trim()).filter(x=>x) : kw;
-    return arr.slice(0,8).map(k => '<span class="keyword">' + k + '</span>').join('');
+    return arr.slice(0,8).map(k => '<span class="keyword">' + esc(k) + '</span>').join('');
 }
 
-function generateCard(p, topic) {
-    const id = p.arxiv_id || '';
-    const c = TOPIC_COLORS[topic] || '#1e40af';
-    return '<article class="paper-card" data-cat="' + topic + '" style="border-left-color:' + c + '"><div class="paper-header"><div class="paper-category" style="color:' + c + '">' + topic + ' · ' + (p.category || p.primary_category || 'cs.AI') + '</div><h3 class="paper-title"><a href="https://arxiv.org/abs/' + id + '" target="_blank">' + (p.title || '无标题') + '</a></h3></div><div class="paper-meta">📅 ' + (p.published || '未知日期') + ' | 🏷️ arXiv:' + id + '</div><div class="paper-body"><p class="paper-summary">' + (p.llm_summary || '') + '</p></div><div class="paper-footer"><div class="paper-authors">' + formatAuthors(p.authors) + '</div><div class="paper-keywords">' + formatKeywords(p.llm_keywords) + '</div></div><div class="paper-actions"><a href="' + (p.pdf_url || 'https://arxiv.org/pdf/' + id) + '" class="btn btn-primary" target="_blank">📄 PDF</a><a href="https://arxiv.org/abs/' + id + '" class="btn btn-secondary" target="_blank">🔗 arXiv</a></div></article>';
+// t is the already-escaped topic label and c its color, both resolved once per section
+function generateCard(p, t, c) {
+    // Escape every interpolated field once; paper data comes from LLM output and arXiv metadata
+    const id = esc(p.arxiv_id || '');
+    const absUrl = 'https://arxiv.org/abs/' + id;
+    return '<article class="paper-card" style="border-left-color:' + c + '"><div class="paper-header"><div class="paper-category" style="color:' + c + '">' + t + ' · ' + esc(p.category || p.primary_category || 'cs.AI') + '</div><h3 class="paper-title"><a href="' + absUrl + '" target="_blank">' + esc(p.title || '无标题') + '</a></h3></div><div class="paper-meta">📅 ' + esc(p.published || '未知日期') + ' | 🏷️ arXiv:' + id + '</div><div class="paper-body"><p class="paper-summary">' + esc(p.llm_summary || '') + '</p></div><div class="paper-footer"><div class="paper-authors">' + formatAuthors(p.authors) + '</div><div class="paper-keywords">' + formatKeywords(p.llm_keywords) + '</div></div><div class="paper-actions"><a href="' + (p.pdf_url ? esc(p.pdf_url) : 'https://arxiv.org/pdf/' + id) + '" class="btn btn-primary" target="_blank">📄 PDF</a><a href="' + absUrl + '" class="btn btn-secondary" target="_blank">🔗 arXiv</a></div></article>';
 }
 
 function renderStats() {
     const el = document.getElementById('stats-grid');
     let html = "<div class='stat-item active' data-filter='all'><span class='stat-dot' style='background:var(--accent)'></span><span>全部</span><span>" + (data.total_count || 0) + "</span></div>";
-    (data.topics || []).forEach(t => {
+    (data.topics || []).forEach((t, i) => {
         const n = (data.papers_by_topic[t] || []).length;
         const c = TOPIC_COLORS[t] || '#1e40af';
-        html += '<div class="stat-item" data-filter="' + t + '"><span class="stat-dot" style="background:' + c + '"></span><span>' + t + '</span><span>' + n + '</span></div>';
+        const et = esc(t);
+        html += '<div class="stat-item" data-filter="' + i + '"><span class="stat-dot" style="background:' + c + '"></span><span>' + et + '</span><span>' + n + '</span></div>';
     });
     el.innerHTML = html;
+    statItems = el.querySelectorAll('.stat-item');
     // Bind click events
-    el.querySelectorAll('.stat-item').forEach(item => {
+    statItems.forEach(item => {
         item.addEventListener('click', function() {
             setFilter(this.dataset.filter);
         });
@@ -171,44 +173,50 @@ function renderStats() {
 function renderSections() {
     const el = document.getElementById('sections');
     let html = '';
-    (data.topics || []).forEach(t => {
+    (data.topics || []).forEach((t, i) => {
         const papers = data.papers_by_topic[t] || [];
         if (papers.length === 0) return;
         const c = TOPIC_COLORS[t] || '#1e40af';
-        html += "<section data-topic='" + t + "'><div class='section-header' style='border-left-color:" + c + "'><span style='color:" + c + "'>◆</span><span class='section-title'>" + t + "</span><span class='section-count'>" + papers.length + " 篇论文</span></div><div class='papers-grid'>" + papers.map(p => generateCard(p, t)).join('') + "</div></section>";
+        const et = esc(t);
+        html += "<section data-topic='" + et + "' data-idx='" + i + "'><div class='section-header' style='border-left-color:" + c + "'><span style='color:" + c + "'>◆</span><span class='section-title'>" + et + "</span><span class='section-count'>" + papers.length + " 篇论文</span></div><div class='papers-grid'>" + papers.map(p => generateCard(p, et, c)).join('') + "</div></section>";
     });
     el.innerHTML = html;
 }
 
+// One rule per topic keyed by its index: switching filters is a single body class swap
+// and the style engine hides the other sections, however many cards there are
+function renderFilterRules() {
+    const rules = (data.topics || []).map((t, i) => 'body.filter-' + i + ' #sections > section:not([data-idx="' + i + '"]) { display: none; }');
+    document.getElementById('filter-rules').textContent = rules.join('');
+}
+
 function render() {
     document.getElementById('header-total').textContent = data.total_count || 0;
     const dr = data.date_range || {};
     document.getElementById('header-range').textContent = dr.start_date ? dr.start_date + ' - ' + dr.end_date : '';
+    renderFilterRules();
     renderStats();
     renderSections();
 }
 
 function setFilter(f) {
-    filter = f;
-    document.querySelectorAll('.stat-item').forEach(el => el.classList.toggle('active', el.dataset.filter === f));
-    document.querySelectorAll('.paper-card').forEach(el => el.classList.toggle('hidden', f !== 'all' && el.dataset.cat !== f));
-    document.querySelectorAll('section').forEach(el => {
-        const visible = el.querySelectorAll('.paper-card:not(.hidden)').length;
-        el.classList.toggle('hidden', f !== 'all' && visible === 0);
-    });
+    for (const el of statItems) el.classList.toggle('active', el.dataset.filter === f);
+    document.body.className = 'filter-' + f;
 }
 
 loadData();
 """
 
-# Build HTML with back link
-html = f"""<!DOCTYPE html>
+
+# Page skeleton with back link; compiled once and filled with str.format in main()
+HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="zh-CN">
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width, initial-scale=1.0">
 <title>医疗AI学术进展</title>
 <style>{css}</style>
+<style id="filter-rules"></style>
 </head>
 <body>
 <header class="header">
@@ -247,8 +255,29 @@ html = f"""<!DOCTYPE html>
 </body>
 </html>"""
 
-output = os.path.join(OUTPUT_DIR, 'report.html')
-with open(output, 'w', encoding='utf-8') as f:
-    f.write(html)
-print('Generated:', output)
-print('Usage: report.html?date=YYYY-MM-DD')
+
+def main(argv=None):
+    load_dotenv()
+
+    argv = sys.argv[1:] if argv is None else argv
+    output_dir = argv[0] if argv else os.getenv('OUTPUT_DIR', 'docs')
+    os.makedirs(output_dir, exist_ok=True)
+
+    topics_raw = os.getenv('TOPICS', '')
+    topics = tuple(t.strip() for t in topics_raw.split(',') if t.strip())
+
+    # Build topic colors JS as a single object literal
+    topic_colors = {topic: get_topic_color(topic) for topic in topics}
+    js_colors = f'const TOPIC_COLORS = {json.dumps(topic_colors, ensure_ascii=False)};\n'
+
+    html = HTML_TEMPLATE.format(css=css, js_colors=js_colors, js=js)
+
+    output = os.path.join(output_dir, 'report.html')
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(html)
+    print('Generated:', output)
+    print('Usage: report.html?date=YYYY-MM-DD')
+
+
+if __name__ == '__main__':
+    main()
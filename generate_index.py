@@ -5,73 +5,163 @@ Academic professional design
 """
 import os
 import json
-from datetime import datetime, timedelta
-from pathlib import Path
-from utils import load_json
+import argparse
+import hashlib
+import calendar
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from utils import _json_loads, iter_day_dirs, iter_year_dirs, load_json, save_json
+
+# Manifest of per-day metadata, kept outside docs/ so it is never published or
+# committed with the reports (CI restores it with actions/cache)
+INDEX_CACHE_FILE = '.index_cache.json'
+# Fingerprint of the inputs that produced the current docs/index.html; it changes
+# daily, so like the manifest it stays outside docs/ and out of the report commits
+INDEX_HASH_FILE = '.index.hash'
+
+
+@lru_cache(maxsize=None)
+def _mkdate(year, month, day):
+    """Memoized datetime construction for report dates"""
+    return datetime(year, month, day)
 
-def scan_reports(docs_dir='docs'):
-    """Scan docs directory for all dated reports"""
-    reports = []
-    docs_path = Path(docs_dir)
 
-    if not docs_path.exists():
-        return reports
+@lru_cache(maxsize=None)
+def _month_layout(year, month):
+    """Return (leading blank cells with Sunday first, days in month) for a calendar month"""
+    first_weekday, days_in_month = calendar.monthrange(year, month)  # Monday=0
+    return (first_weekday + 1) % 7, days_in_month
 
-    # Scan year/month/day directory structure
-    for year_dir in sorted(docs_path.iterdir(), reverse=True):
-        if not year_dir.is_dir() or not year_dir.name.isdigit():
-            continue
-        year = year_dir.name
 
-        for month_dir in sorted(year_dir.iterdir(), reverse=True):
-            if not month_dir.is_dir() or not month_dir.name.isdigit():
+def _load_metadata(day_path, key, mtime_ns, cache, fresh):
+    """Return the index fields of a day's metadata.json, reusing the cached copy when unchanged
+
+    An unchanged mtime skips the read entirely. A fresh checkout resets every
+    mtime, so the cached copy is also reused when the file's content hash matches.
+    """
+    cached = cache.get(key) or {}
+    if cached.get('mtime') == mtime_ns and 'hash' in cached:
+        fresh[key] = cached
+        return cached['metadata']
+
+    try:
+        with open(os.path.join(day_path, 'metadata.json'), 'rb') as f:
+            data = f.read()
+    except OSError:
+        data = b''
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if cached.get('hash') == digest:
+        metadata = cached['metadata']
+    else:
+        try:
+            raw = _json_loads(data)
+        except ValueError:
+            raw = {}
+        if not isinstance(raw, dict):
+            raw = {}
+        metadata = {field: raw[field] for field in ('paper_count', 'topics', 'date_range') if field in raw}
+    fresh[key] = {'mtime': mtime_ns, 'hash': digest, 'metadata': metadata}
+    return metadata
+
+
+def _scan_year(year_entry, cache, fresh):
+    """Collect the reports under one docs/YYYY directory
+
+    cache holds the manifest from the previous run; entries for every
+    metadata.json seen are written to fresh.
+    """
+    reports = []
+    year = year_entry.name
+
+    for month, day_entry in iter_day_dirs(year_entry):
+        # Handle day directories with optional suffix (e.g., "28", "28-1", "28-2")
+        day_name = day_entry.name
+        day = day_name.split('-')[0]  # Get base day number
+
+        # One directory read answers both existence checks below
+        file_names = set()
+        metadata_mtime = None
+        with os.scandir(day_entry.path) as it:
+            for entry in it:
+                file_names.add(entry.name)
+                if entry.name == 'metadata.json':
+                    metadata_mtime = entry.stat().st_mtime_ns
+
+        if 'papers_data.json' in file_names:
+            date_str = f"{year}-{month}-{day}"
+            try:
+                y, m, d = int(year), int(month), int(day)
+                date_obj = _mkdate(y, m, d)
+            except ValueError:
                 continue
-            month = month_dir.name
-
-            for day_dir in sorted(month_dir.iterdir(), reverse=True):
-                if not day_dir.is_dir():
-                    continue
-                # Handle day directories with optional suffix (e.g., "28", "28-1", "28-2")
-                day_name = day_dir.name
-                day_base = day_name.split('-')[0]  # Get base day number
-                if not day_base.isdigit():
-                    continue
-                day = day_base
-
-                report_file = day_dir / 'papers_data.json'
-                if report_file.exists():
-                    date_str = f"{year}-{month}-{day}"
-                    try:
-                        date_obj = datetime(int(year), int(month), int(day))
-                    except ValueError:
-                        continue
-
-                    # Try to load metadata from categorized_papers.json if exists
-                    metadata = {}
-                    metadata_file = day_dir / 'metadata.json'
-                    if metadata_file.exists():
-                        metadata = load_json(metadata_file, {})
-
-                    # Get date range from metadata
-                    date_range = metadata.get('date_range', {})
-
-                    # Use full directory name (including suffix) for path
-                    full_dir_name = day_dir.name
-
-                    reports.append({
-                        'date': date_str,
-                        'date_obj': date_obj,
-                        'path': f'report.html?date={date_str}',  # Use shared template with date parameter
-                        'data_path': f'{year}/{month}/{full_dir_name}/papers_data.json',  # Keep data path for reference
-                        'year': year,
-                        'month': month,
-                        'day': day,
-                        'paper_count': metadata.get('paper_count', 0),
-                        'topics': metadata.get('topics', []),
-                        'date_range': date_range
-                    })
-
-    return sorted(reports, key=lambda x: x['date_obj'], reverse=True)
+
+            # Try to load metadata from categorized_papers.json if exists
+            metadata = {}
+            if metadata_mtime is not None:
+                metadata = _load_metadata(
+                    day_entry.path, f'{year}/{month}/{day_name}', metadata_mtime, cache, fresh
+                )
+
+            # Get date range from metadata
+            date_range = metadata.get('date_range', {})
+            date_range_text = ''
+            if date_range.get('start_date'):
+                date_range_text = f"{date_range['start_date']} — {date_range['end_date']}"
+
+            reports.append({
+                'date': date_str,
+                'date_obj': date_obj,
+                'path': f'report.html?date={date_str}',  # Use shared template with date parameter
+                'data_path': f'{year}/{month}/{day_name}/papers_data.json',  # Keep data path for reference
+                'year': year,
+                'month': month,
+                'day': day,
+                'paper_count': metadata.get('paper_count', 0),
+                'topics': metadata.get('topics', []),
+                'date_range': date_range,
+                # Display strings derived once here so rendering is pure substitution
+                'date_cn': f'{y:04d}年{m:02d}月{d:02d}日',
+                'date_range_text': date_range_text,
+                # Integer tuple sorts faster than datetime; the directory name orders "28-1" before "28"
+                'sort_key': (y, m, d, day_name)
+            })
+
+    return reports
+
+
+def scan_reports(docs_dir='docs', cache_path=INDEX_CACHE_FILE):
+    """Scan docs directory for all dated reports
+
+    Metadata is memoized in cache_path keyed by day directory, with the
+    metadata.json mtime and content hash, so unchanged reports are not re-parsed.
+    """
+    if not os.path.isdir(docs_dir):
+        return []
+
+    cache = load_json(cache_path, {})
+    if not isinstance(cache, dict):
+        cache = {}
+    fresh = {}
+
+    year_entries = list(iter_year_dirs(docs_dir))
+
+    # Years are independent subtrees; scan them on threads when there are enough
+    # of them to amortize the pool (scandir/open/read release the GIL)
+    if len(year_entries) > 2:
+        with ThreadPoolExecutor(max_workers=min(8, len(year_entries))) as pool:
+            per_year = list(pool.map(lambda entry: _scan_year(entry, cache, fresh), year_entries))
+    else:
+        per_year = [_scan_year(entry, cache, fresh) for entry in year_entries]
+
+    # Rewrite the manifest only when something changed, via rename so readers never see a partial file
+    if fresh != cache:
+        tmp_path = cache_path + '.tmp'
+        if save_json(tmp_path, fresh):
+            os.replace(tmp_path, cache_path)
+
+    reports = [report for year_reports in per_year for report in year_reports]
+    return sorted(reports, key=lambda x: x['sort_key'], reverse=True)
 
 def build_calendar_data(reports):
     """
@@ -105,6 +195,22 @@ def build_calendar_data(reports):
 
     return calendar_data
 
+# 月份名称与星期标题（周日开头），按下标直接取值
+_MONTH_NAMES_CN = ('一月', '二月', '三月', '四月', '五月', '六月',
+                   '七月', '八月', '九月', '十月', '十一月', '十二月')
+_WEEKDAYS_CN = ('日', '一', '二', '三', '四', '五', '六')
+_WEEKDAYS_HTML = ''.join(f'<div class="calendar-weekday">{wd}</div>' for wd in _WEEKDAYS_CN)
+
+# 无报告日期的格子只随日期变化，预先渲染 1-31 日，按日期下标取用
+_NO_REPORT_CELLS = ('',) + tuple(
+    f'''<div class="calendar-day no-report">
+                <span class="day-number">{day}</span>
+                <span class="day-count">无报告</span>
+            </div>'''
+    for day in range(1, 32)
+)
+
+
 def generate_calendar_html(calendar_data, year, month, prev_month_url=None, next_month_url=None):
     """
     生成指定年月的日历HTML
@@ -124,35 +230,17 @@ def generate_calendar_html(calendar_data, year, month, prev_month_url=None, next
     month_int = int(month)
     year_int = int(year)
 
-    # 计算月份第一天是星期几 (0=周日)
-    first_day = datetime(year_int, month_int, 1)
-    first_weekday = first_day.weekday()  # Monday=0, Sunday=6
-    # 转换为 0=周日 格式
-    first_weekday = (first_weekday + 1) % 7
-
-    # 计算月份总天数
-    if month_int == 12:
-        next_month = datetime(year_int + 1, 1, 1)
-    else:
-        next_month = datetime(year_int, month_int + 1, 1)
-    days_in_month = (next_month - first_day).days
+    # 月份第一天是星期几 (0=周日) 及月份总天数
+    first_weekday, days_in_month = _month_layout(year_int, month_int)
 
     # 月份名称
-    month_names = ['一月', '二月', '三月', '四月', '五月', '六月',
-                   '七月', '八月', '九月', '十月', '十一月', '十二月']
-    month_name = month_names[month_int - 1]
+    month_name = _MONTH_NAMES_CN[month_int - 1]
 
     # 获取当前月份的数据
     month_data = calendar_data.get(year_str, {}).get(month_str, {})
 
-    # 生成星期标题
-    weekdays = ['日', '一', '二', '三', '四', '五', '六']
-    weekdays_html = ''.join([f'<div class="calendar-weekday">{wd}</div>' for wd in weekdays])
-
-    # 生成前导空白格子
-    days_html = ''
-    for _ in range(first_weekday):
-        days_html += '<div class="calendar-day empty"></div>'
+    # 生成前导空白格子（收集到列表，最后一次性 join）
+    day_cells = ['<div class="calendar-day empty"></div>'] * first_weekday
 
     # 遍历每一天
     for day in range(1, days_in_month + 1):
@@ -173,17 +261,16 @@ def generate_calendar_html(calendar_data, year, month, prev_month_url=None, next
                 day_class = 'calendar-day has-report'
                 badge_html = ''
 
-            days_html += f'''<a href="{path}" class="{day_class}">
+            day_cells.append(f'''<a href="{path}" class="{day_class}">
                 <span class="day-number">{day}</span>
                 <span class="day-count">{count} 篇</span>
                 {badge_html}
-            </a>'''
+            </a>''')
         else:
             # 无报告日期（包括 count == 0 或不在 month_data 中）
-            days_html += f'''<div class="calendar-day no-report">
-                <span class="day-number">{day}</span>
-                <span class="day-count">无报告</span>
-            </div>'''
+            day_cells.append(_NO_REPORT_CELLS[day])
+
+    days_html = ''.join(day_cells)
 
     # 导航按钮
     prev_btn = f'<a href="{prev_month_url}" class="calendar-nav-btn">←</a>' if prev_month_url else '<span class="calendar-nav-btn disabled">←</span>'
@@ -216,7 +303,7 @@ def generate_calendar_html(calendar_data, year, month, prev_month_url=None, next
     </div>
     <div class="calendar-grid">
         <div class="calendar-weekdays">
-            {weekdays_html}
+            {_WEEKDAYS_HTML}
         </div>
         <div class="calendar-days">
             {days_html}
@@ -227,69 +314,11 @@ def generate_calendar_html(calendar_data, year, month, prev_month_url=None, next
 
     return html
 
-def generate_index(reports, docs_dir='docs', current_year=None, current_month=None):
-    """Generate index HTML page with calendar view"""
 
-    # Build calendar data
-    calendar_data = build_calendar_data(reports)
-
-    # Determine which month to display (default to latest report's month or current month)
-    if reports:
-        latest_report = reports[0]
-        default_year = int(latest_report['year'])
-        default_month = int(latest_report['month'])
-    else:
-        now = datetime.now()
-        default_year = now.year
-        default_month = now.month
-
-    # Use provided values or defaults
-    display_year = current_year if current_year is not None else default_year
-    display_month = current_month if current_month is not None else default_month
-
-    # Calculate previous/next month URLs
-    def get_month_url(year, month, offset):
-        """Get URL for month offset (prev/next)"""
-        from datetime import timedelta
-        target_date = datetime(year, month, 15) + timedelta(days=offset * 30)
-        # Adjust to first day of target month
-        target_year = target_date.year
-        target_month = target_date.month
-        return f"?year={target_year}&month={target_month}"
-
-    # Check if we have reports for prev/next month
-    prev_month_url = get_month_url(display_year, display_month, -1) if calendar_data else None
-    next_month_url = get_month_url(display_year, display_month, 1) if calendar_data else None
-
-    # Generate calendar HTML
-    calendar_html = generate_calendar_html(
-        calendar_data, display_year, display_month,
-        prev_month_url=prev_month_url,
-        next_month_url=next_month_url
-    )
-
-    # Generate latest report preview (keep this logic)
-    latest_report = reports[0] if reports else None
-    latest_html = ''
-    if latest_report:
-        date_range_text = ''
-        if latest_report.get('date_range', {}).get('start_date'):
-            dr = latest_report['date_range']
-            date_range_text = f"{dr['start_date']} — {dr['end_date']}"
-
-        latest_html = f'''
-        <div class="latest-report">
-            <div class="latest-header">
-                <span class="latest-badge">最新</span>
-                <span class="latest-date">{latest_report['date_obj'].strftime('%Y年%m月%d日')}</span>
-            </div>
-            <h2 class="latest-title">学术进展周报</h2>
-            <p class="latest-desc">{latest_report['paper_count']} 篇精选论文 · {date_range_text}</p>
-            <a href="{latest_report['path']}" class="btn-primary">查看报告 →</a>
-        </div>
-        '''
-
-    html = f'''<!DOCTYPE html>
+# Page skeleton, parsed once at import. It is split around the calendar so
+# iter_index() can emit the page in chunks: head + CSS, top, calendar, bottom.
+# Only INDEX_TEMPLATE_TOP and INDEX_TEMPLATE_BOTTOM have placeholders.
+INDEX_HEAD = '''<!DOCTYPE html>
 <html lang="zh-CN">
 <head>
     <meta charset="UTF-8">
@@ -299,7 +328,10 @@ def generate_index(reports, docs_dir='docs', current_year=None, current_month=No
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,400;0,600;0,700;1,400&family=Inter:wght@400;500;600&display=swap" rel="stylesheet">
     <style>
-        :root {{
+'''
+
+# Stylesheet kept as a plain string (not a format template), so braces need no escaping
+INDEX_CSS = '''        :root {
             --color-bg: #fafafa;
             --color-surface: #ffffff;
             --color-border: #e5e7eb;
@@ -311,32 +343,32 @@ def generate_index(reports, docs_dir='docs', current_year=None, current_month=No
             --color-accent-light: #dbeafe;
             --font-serif: 'Crimson Pro', Georgia, 'Times New Roman', serif;
             --font-sans: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-        }}
+        }
 
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        * { margin: 0; padding: 0; box-sizing: border-box; }
 
-        body {{
+        body {
             font-family: var(--font-sans);
             background: var(--color-bg);
             color: var(--color-text);
             line-height: 1.6;
             font-size: 17px;
-        }}
+        }
 
         /* Header */
-        .header {{
+        .header {
             background: var(--color-surface);
             border-bottom: 1px solid var(--color-border);
-        }}
+        }
 
-        .header-content {{
+        .header-content {
             max-width: 1000px;
             margin: 0 auto;
             padding: 32px 24px 24px;
             text-align: center;
-        }}
+        }
 
-        .header-logo {{
+        .header-logo {
             width: 48px;
             height: 48px;
             background: var(--color-accent);
@@ -349,39 +381,39 @@ def generate_index(reports, docs_dir='docs', current_year=None, current_month=No
             font-size: 24px;
             font-weight: 700;
             margin: 0 auto 16px;
-        }}
+        }
 
-        .header-title {{
+        .header-title {
             font-family: var(--font-serif);
             font-size: 30px;
             font-weight: 700;
             letter-spacing: -0.02em;
             margin-bottom: 8px;
-        }}
+        }
 
-        .header-subtitle {{
+        .header-subtitle {
             font-size: 16px;
             color: var(--color-text-muted);
-        }}
+        }
 
         /* Main */
-        .main {{
+        .main {
             max-width: 1000px;
             margin: 0 auto;
             padding: 20px 24px 40px;
-        }}
+        }
 
         /* Latest Report */
-        .latest-report {{
+        .latest-report {
             background: var(--color-surface);
             border: 1px solid var(--color-border);
             border-radius: 8px;
             padding: 24px;
             margin-bottom: 32px;
             position: relative;
-        }}
+        }
 
-        .latest-report::before {{
+        .latest-report::before {
             content: '';
             position: absolute;
             top: 0;
@@ -390,16 +422,16 @@ def generate_index(reports, docs_dir='docs', current_year=None, current_month=No
             height: 3px;
             background: var(--color-accent);
             border-radius: 8px 8px 0 0;
-        }}
+        }
 
-        .latest-header {{
+        .latest-header {
             display: flex;
             align-items: center;
             gap: 12px;
             margin-bottom: 12px;
-        }}
+        }
 
-        .latest-badge {{
+        .latest-badge {
             font-size: 11px;
             font-weight: 600;
             text-transform: uppercase;
@@ -408,27 +440,27 @@ def generate_index(reports, docs_dir='docs', current_year=None, current_month=No
             background: var(--color-accent-light);
             padding: 4px 10px;
             border-radius: 4px;
-        }}
+        }
 
-        .latest-date {{
+        .latest-date {
             font-size: 13px;
             color: var(--color-text-muted);
-        }}
+        }
 
-        .latest-title {{
+        .latest-title {
             font-family: var(--font-serif);
             font-size: 24px;
             font-weight: 700;
             margin-bottom: 8px;
-        }}
+        }
 
-        .latest-desc {{
+        .latest-desc {
             font-size: 16px;
             color: var(--color-text-secondary);
             margin-bottom: 24px;
-        }}
+        }
 
-        .btn-primary {{
+        .btn-primary {
             display: inline-flex;
             align-items: center;
             gap: 8px;
@@ -440,39 +472,39 @@ def generate_index(reports, docs_dir='docs', current_year=None, current_month=No
             text-decoration: none;
             border-radius: 6px;
             transition: background 0.15s;
-        }}
+        }
 
-        .btn-primary:hover {{
+        .btn-primary:hover {
             background: #1e3a8a;
-        }}
+        }
 
         /* Calendar Container */
-        .calendar-container {{
+        .calendar-container {
             background: var(--color-surface);
             border: 1px solid var(--color-border);
             border-radius: 12px;
             padding: 24px;
             margin-bottom: 24px;
-        }}
+        }
 
         /* Calendar Header */
-        .calendar-header {{
+        .calendar-header {
             display: flex;
             align-items: center;
             justify-content: space-between;
             margin-bottom: 20px;
             padding-bottom: 16px;
             border-bottom: 1px solid var(--color-border-light);
-        }}
+        }
 
-        .calendar-title {{
+        .calendar-title {
             font-family: var(--font-serif);
             font-size: 24px;
             font-weight: 700;
             color: var(--color-text);
-        }}
+        }
 
-        .calendar-nav-btn {{
+        .calendar-nav-btn {
             display: flex;
             align-items: center;
             justify-content: center;
@@ -486,49 +518,49 @@ def generate_index(reports, docs_dir='docs', current_year=None, current_month=No
             text-decoration: none;
             transition: all 0.15s;
             cursor: pointer;
-        }}
+        }
 
-        .calendar-nav-btn:hover {{
+        .calendar-nav-btn:hover {
             background: var(--color-bg);
             border-color: var(--color-text-muted);
-        }}
+        }
 
-        .calendar-nav-btn.disabled {{
+        .calendar-nav-btn.disabled {
             opacity: 0.4;
             cursor: not-allowed;
             pointer-events: none;
-        }}
+        }
 
         /* Calendar Grid */
-        .calendar-grid {{
+        .calendar-grid {
             display: flex;
             flex-direction: column;
-        }}
+        }
 
         /* Weekdays Row */
-        .calendar-weekdays {{
+        .calendar-weekdays {
             display: grid;
             grid-template-columns: repeat(7, 1fr);
             gap: 8px;
             margin-bottom: 8px;
-        }}
+        }
 
-        .calendar-weekday {{
+        .calendar-weekday {
             text-align: center;
             font-size: 13px;
             font-weight: 600;
             color: var(--color-text-muted);
             padding: 8px;
-        }}
+        }
 
         /* Days Grid */
-        .calendar-days {{
+        .calendar-days {
             display: grid;
             grid-template-columns: repeat(7, 1fr);
             gap: 8px;
-        }}
+        }
 
-        .calendar-day {{
+        .calendar-day {
             aspect-ratio: 1;
             display: flex;
             flex-direction: column;
@@ -541,49 +573,49 @@ def generate_index(reports, docs_dir='docs', current_year=None, current_month=No
             color: inherit;
             transition: all 0.15s;
             min-height: 80px;
-        }}
+        }
 
-        .calendar-day.empty {{
+        .calendar-day.empty {
             border: none;
             background: transparent;
             pointer-events: none;
-        }}
+        }
 
-        .calendar-day.no-report {{
+        .calendar-day.no-report {
             background: linear-gradient(145deg, #f8fafc, #e2e8f0);
             border-color: #cbd5e1;
             color: #94a3b8;
             cursor: default;
-        }}
+        }
 
-        .calendar-day.no-report .day-count {{
+        .calendar-day.no-report .day-count {
             font-size: 11px;
             opacity: 0.7;
-        }}
+        }
 
-        .calendar-day.has-report {{
+        .calendar-day.has-report {
             background: linear-gradient(135deg, #4f46e5 0%, #7c3aed 100%);
             border-color: transparent;
             color: white;
             cursor: pointer;
             box-shadow: 0 2px 8px rgba(79, 70, 229, 0.25);
-        }}
+        }
 
-        .calendar-day.has-report:hover {{
+        .calendar-day.has-report:hover {
             background: linear-gradient(135deg, #4338ca 0%, #6d28d9 100%);
             transform: translateY(-2px);
             box-shadow: 0 8px 20px rgba(79, 70, 229, 0.35);
-        }}
+        }
 
-        .calendar-day.latest {{
+        .calendar-day.latest {
             background: linear-gradient(135deg, #0f172a 0%, #1e293b 50%, #334155 100%);
             border-color: transparent;
             box-shadow: 0 4px 12px rgba(15, 23, 42, 0.35);
             position: relative;
             overflow: hidden;
-        }}
+        }
 
-        .calendar-day.latest::before {{
+        .calendar-day.latest::before {
             content: '';
             position: absolute;
             top: 0;
@@ -592,121 +624,123 @@ def generate_index(reports, docs_dir='docs', current_year=None, current_month=No
             bottom: 0;
             background: linear-gradient(135deg, rgba(99, 102, 241, 0.3) 0%, transparent 50%);
             pointer-events: none;
-        }}
+        }
 
-        .calendar-day.latest:hover {{
+        .calendar-day.latest:hover {
             background: linear-gradient(135deg, #020617 0%, #0f172a 50%, #1e293b 100%);
             box-shadow: 0 8px 24px rgba(15, 23, 42, 0.45);
-        }}
+        }
 
-        .day-number {{
+        .day-number {
             font-size: 18px;
             font-weight: 600;
             margin-bottom: 4px;
-        }}
+        }
 
-        .day-count {{
+        .day-count {
             font-size: 12px;
             opacity: 0.9;
-        }}
+        }
 
-        .day-latest-badge {{
+        .day-latest-badge {
             font-size: 10px;
             font-weight: 600;
             background: rgba(255, 255, 255, 0.2);
             padding: 2px 6px;
             border-radius: 4px;
             margin-top: 4px;
-        }}
+        }
 
         /* Calendar Legend */
-        .calendar-legend {{
+        .calendar-legend {
             display: flex;
             gap: 20px;
             margin-top: 20px;
             padding-top: 16px;
             border-top: 1px solid var(--color-border-light);
             justify-content: center;
-        }}
+        }
 
-        .legend-item {{
+        .legend-item {
             display: flex;
             align-items: center;
             gap: 8px;
             font-size: 13px;
             color: var(--color-text-secondary);
-        }}
+        }
 
-        .legend-color {{
+        .legend-color {
             width: 16px;
             height: 16px;
             border-radius: 4px;
             border: 1px solid var(--color-border);
-        }}
+        }
 
-        .legend-color.latest {{
+        .legend-color.latest {
             background: linear-gradient(135deg, #0f172a 0%, #1e293b 50%, #334155 100%);
             border-color: transparent;
-        }}
+        }
 
-        .legend-color.has-report {{
+        .legend-color.has-report {
             background: linear-gradient(135deg, #4f46e5 0%, #7c3aed 100%);
             border-color: transparent;
-        }}
+        }
 
-        .legend-color.no-report {{
+        .legend-color.no-report {
             background: linear-gradient(145deg, #f8fafc, #e2e8f0);
             border-color: #cbd5e1;
-        }}
+        }
 
         /* Footer */
-        .footer {{
+        .footer {
             max-width: 1000px;
             margin: 0 auto;
             padding: 20px 24px;
             border-top: 1px solid var(--color-border);
             text-align: center;
-        }}
+        }
 
-        .footer-text {{
+        .footer-text {
             font-size: 12px;
             color: var(--color-text-muted);
-        }}
+        }
 
         /* Empty State */
-        .empty-state {{
+        .empty-state {
             text-align: center;
             padding: 80px 40px;
             color: var(--color-text-muted);
-        }}
+        }
 
-        .empty-state h2 {{
+        .empty-state h2 {
             font-family: var(--font-serif);
             font-size: 20px;
             color: var(--color-text-secondary);
             margin-bottom: 8px;
-        }}
+        }
 
         /* Responsive */
-        @media (max-width: 768px) {{
-            .header-content {{ padding: 24px 20px 20px; }}
-            .header-title {{ font-size: 24px; }}
-            .main {{ padding: 16px 16px 32px; }}
-            .latest-report {{ padding: 20px; }}
-            .calendar-container {{ padding: 16px; }}
-            .calendar-title {{ font-size: 20px; }}
-            .calendar-day {{ min-height: 60px; }}
-            .day-number {{ font-size: 14px; }}
-            .day-count {{ font-size: 10px; }}
-            .calendar-legend {{ flex-direction: column; gap: 10px; align-items: center; }}
-        }}
-
-        @media (max-width: 480px) {{
-            .calendar-day {{ min-height: 50px; }}
-            .day-number {{ font-size: 12px; }}
-            .day-count {{ display: none; }}
-        }}
-    </style>
+        @media (max-width: 768px) {
+            .header-content { padding: 24px 20px 20px; }
+            .header-title { font-size: 24px; }
+            .main { padding: 16px 16px 32px; }
+            .latest-report { padding: 20px; }
+            .calendar-container { padding: 16px; }
+            .calendar-title { font-size: 20px; }
+            .calendar-day { min-height: 60px; }
+            .day-number { font-size: 14px; }
+            .day-count { font-size: 10px; }
+            .calendar-legend { flex-direction: column; gap: 10px; align-items: center; }
+        }
+
+        @media (max-width: 480px) {
+            .calendar-day { min-height: 50px; }
+            .day-number { font-size: 12px; }
+            .day-count { display: none; }
+        }
+'''
+
+INDEX_TEMPLATE_TOP = '''    </style>
 </head>
 <body>
     <header class="header">
@@ -718,49 +752,153 @@ def generate_index(reports, docs_dir='docs', current_year=None, current_month=No
     </header>
 
     <main class="main">
-        {latest_html if latest_report else '<div class="empty-state"><h2>暂无报告</h2><p>报告将自动生成</p></div>'}
+        {latest_html}
+
+        {archive_header}
+        '''
 
-        {'<h2 style="font-family: var(--font-serif); font-size: 20px; font-weight: 700; margin-bottom: 16px;">历史归档</h2>' if reports else ''}
-        {calendar_html}
+INDEX_TEMPLATE_BOTTOM = '''
     </main>
 
     <footer class="footer">
-        <p class="footer-text">生成于 {datetime.now().strftime('%Y-%m-%d')} · 数据来源：arXiv.org</p>
+        <p class="footer-text">生成于 {generated_date} · 数据来源：arXiv.org</p>
     </footer>
 </body>
 </html>
 '''
 
-    return html
+EMPTY_STATE_HTML = '<div class="empty-state"><h2>暂无报告</h2><p>报告将自动生成</p></div>'
+ARCHIVE_HEADER_HTML = '<h2 style="font-family: var(--font-serif); font-size: 20px; font-weight: 700; margin-bottom: 16px;">历史归档</h2>'
+
+
+def iter_index(reports, current_year=None, current_month=None):
+    """Yield the index HTML page with calendar view in chunks"""
 
-def main():
-    import argparse
+    # Build calendar data
+    calendar_data = build_calendar_data(reports)
 
+    # Determine which month to display (default to latest report's month or current month)
+    if reports:
+        latest_report = reports[0]
+        default_year = int(latest_report['year'])
+        default_month = int(latest_report['month'])
+    else:
+        now = datetime.now()
+        default_year = now.year
+        default_month = now.month
+
+    # Use provided values or defaults
+    display_year = current_year if current_year is not None else default_year
+    display_month = current_month if current_month is not None else default_month
+
+    # Calculate previous/next month URLs
+    def get_month_url(year, month, offset):
+        """Get URL for month offset (prev/next)"""
+        # Plain month arithmetic; no datetime/timedelta objects needed
+        target_year, target_month = divmod(year * 12 + month - 1 + offset, 12)
+        return f"?year={target_year}&month={target_month + 1}"
+
+    # Check if we have reports for prev/next month
+    prev_month_url = get_month_url(display_year, display_month, -1) if calendar_data else None
+    next_month_url = get_month_url(display_year, display_month, 1) if calendar_data else None
+
+    # Generate calendar HTML
+    calendar_html = generate_calendar_html(
+        calendar_data, display_year, display_month,
+        prev_month_url=prev_month_url,
+        next_month_url=next_month_url
+    )
+
+    # Generate latest report preview (keep this logic)
+    latest_report = reports[0] if reports else None
+    latest_html = ''
+    if latest_report:
+        latest_html = f'''
+        <div class="latest-report">
+            <div class="latest-header">
+                <span class="latest-badge">最新</span>
+                <span class="latest-date">{latest_report['date_cn']}</span>
+            </div>
+            <h2 class="latest-title">学术进展周报</h2>
+            <p class="latest-desc">{latest_report['paper_count']} 篇精选论文 · {latest_report['date_range_text']}</p>
+            <a href="{latest_report['path']}" class="btn-primary">查看报告 →</a>
+        </div>
+        '''
+
+    yield INDEX_HEAD
+    yield INDEX_CSS
+    yield INDEX_TEMPLATE_TOP.format_map({
+        'latest_html': latest_html if latest_report else EMPTY_STATE_HTML,
+        'archive_header': ARCHIVE_HEADER_HTML if reports else '',
+    })
+    yield calendar_html
+    yield INDEX_TEMPLATE_BOTTOM.format(generated_date=datetime.now().strftime('%Y-%m-%d'))
+
+
+def generate_index(reports, docs_dir='docs', current_year=None, current_month=None):
+    """Generate index HTML page with calendar view"""
+    return ''.join(iter_index(reports, current_year=current_year, current_month=current_month))
+
+def index_fingerprint(reports, current_year=None, current_month=None):
+    """Hash everything the index page depends on
+
+    Covers the scanned reports, the requested calendar month, today's date
+    (shown in the footer) and this module's source, so template edits also
+    invalidate it.
+    """
+    with open(__file__, 'rb') as f:
+        source = f.read()
+    payload = json.dumps(
+        [reports, current_year, current_month, datetime.now().strftime('%Y-%m-%d')],
+        default=str, sort_keys=True, ensure_ascii=False
+    ).encode('utf-8')
+    return hashlib.blake2b(source + payload, digest_size=16).hexdigest()
+
+
+def _read_text(filepath):
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def main(argv=None):
     parser = argparse.ArgumentParser(description='Generate index page for historical reports')
     parser.add_argument('--year', type=int, help='Specify year (YYYY)')
     parser.add_argument('--month', type=int, help='Specify month (MM)')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     print("Generating index page for historical reports...")
 
     reports = scan_reports('docs')
     print(f"Found {len(reports)} historical reports")
 
-    html = generate_index(
-        reports,
-        'docs',
-        current_year=args.year,
-        current_month=args.month
-    )
-
     # Ensure docs directory exists
     os.makedirs('docs', exist_ok=True)
 
-    # Write index.html
+    # Skip regeneration when nothing that feeds the page has changed
     index_path = os.path.join('docs', 'index.html')
-    with open(index_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    hash_path = INDEX_HASH_FILE
+    fingerprint = index_fingerprint(reports, args.year, args.month)
+    if os.path.exists(index_path) and _read_text(hash_path) == fingerprint:
+        print(f"Index page unchanged: {index_path}")
+        return
+
+    # Stream index.html to a temp file chunk by chunk, then swap it in atomically
+    # so a web server never serves a half-written page
+    tmp_index_path = index_path + '.tmp'
+    with open(tmp_index_path, 'w', encoding='utf-8', buffering=1 << 20, newline='') as f:
+        f.writelines(iter_index(reports, current_year=args.year, current_month=args.month))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_index_path, index_path)
+
+    tmp_path = hash_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(fingerprint)
+    os.replace(tmp_path, hash_path)
 
     print(f"Index page generated: {index_path}")
     if args.year and args.month:
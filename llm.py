@@ -1,16 +1,121 @@
 #!/usr/bin/env python3
 """LLM client utility"""
-from openai import OpenAI
+from functools import lru_cache
+import httpx
+from openai import AsyncOpenAI, BadRequestError, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
+# HTTP/2 lets concurrent requests share one TLS connection; httpx needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 
+@lru_cache(maxsize=1)
+def _load_env():
+    """Load .env once per process"""
+    load_dotenv()
+
+
+_load_env()
+
+
+def _http_limits():
+    """Connection pool sized so every in-flight request can reuse a kept-alive connection"""
+    concurrency = int(os.getenv('LLM_CONCURRENCY', 16))
+    return httpx.Limits(max_connections=concurrency * 2, max_keepalive_connections=concurrency)
+
+
+@lru_cache(maxsize=1)
 def get_llm_client():
-    """Initialize OpenAI-compatible LLM client from environment variables"""
+    """Initialize OpenAI-compatible LLM client from environment variables
+
+    The client is created once and reused; call get_llm_client.cache_clear()
+    to re-read the environment.
+    """
+    _load_env()
+    api_base = os.getenv('OPENAI_API_BASE', 'https://api.openai.com/v1')
+    api_key = os.getenv('OPENAI_API_KEY', '')
+    if not api_key:
+        return None
+    return OpenAI(
+        base_url=api_base, api_key=api_key,
+        http_client=DefaultHttpxClient(http2=_HTTP2, limits=_http_limits())
+    )
+
+
+def get_async_llm_client():
+    """Create an async OpenAI-compatible LLM client from environment variables
+
+    Not cached: the underlying connection pool is bound to the event loop it
+    is first used on, so each asyncio.run() needs its own client.
+    """
+    _load_env()
     api_base = os.getenv('OPENAI_API_BASE', 'https://api.openai.com/v1')
     api_key = os.getenv('OPENAI_API_KEY', '')
     if not api_key:
         return None
-    return OpenAI(base_url=api_base, api_key=api_key)
+    return AsyncOpenAI(
+        base_url=api_base, api_key=api_key,
+        http_client=DefaultAsyncHttpxClient(http2=_HTTP2, limits=_http_limits())
+    )
+
+
+def clean_markdown_code_blocks(content: str) -> str:
+    """Remove markdown code block wrappers from LLM responses.
+
+    Requests ask for response_format=json_object, so this only matters for
+    OpenAI-compatible endpoints that ignore it or when JSON mode is off;
+    apply it to every create_json_completion(_async) reply.
+    """
+    content = content.strip()
+    if content.startswith('{'):
+        return content
+    if content.startswith('```json'):
+        content = content[7:]
+    elif content.startswith('```'):
+        content = content[3:]
+    if content.endswith('```'):
+        content = content[:-3]
+    return content.strip()
+
+
+# JSON mode (response_format=json_object) saves stripping code fences from replies, but
+# not every OpenAI-compatible server accepts it. LLM_JSON_MODE=false never sends it;
+# otherwise it is dropped for the rest of the process once a server rejects it.
+_json_mode = os.getenv('LLM_JSON_MODE', 'true').lower() == 'true'
+
+
+def create_json_completion(client, **kwargs):
+    """Call client.chat.completions.create asking for a JSON object reply
+
+    If the server answers 400, the request is retried without response_format;
+    when that succeeds, JSON mode stays off for later calls.
+    """
+    global _json_mode
+    if _json_mode:
+        try:
+            return client.chat.completions.create(response_format={'type': 'json_object'}, **kwargs)
+        except BadRequestError as e:
+            print(f"[WARN] LLM request with response_format rejected, retrying without it: {e}")
+        response = client.chat.completions.create(**kwargs)
+        _json_mode = False
+        return response
+    return client.chat.completions.create(**kwargs)
+
+
+async def create_json_completion_async(client, **kwargs):
+    """Async counterpart of create_json_completion for AsyncOpenAI clients"""
+    global _json_mode
+    if _json_mode:
+        try:
+            return await client.chat.completions.create(response_format={'type': 'json_object'}, **kwargs)
+        except BadRequestError as e:
+            print(f"[WARN] LLM request with response_format rejected, retrying without it: {e}")
+        response = await client.chat.completions.create(**kwargs)
+        _json_mode = False
+        return response
+    return await client.chat.completions.create(**kwargs)
@@ -7,26 +7,41 @@ Supports GitHub Pages deployment with dated directories:
 - Reports are saved to docs/YYYY/MM/DD/index.html
 - Index page is updated at docs/index.html
 """
-import subprocess
-import sys
+import traceback
 import os
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
+# (before importing the steps, which read their configuration at import time)
 load_dotenv()
 
-def run_step(name, script, env_vars=None):
+import search_arxiv_medical
+import extract_paper_insights
+import categorize_papers
+import generate_html_report
+import generate_index
+
+
+def run_step(name, step, env_vars=None):
+    """Run a pipeline step in-process, with env_vars applied only for its duration"""
     print(f"\n{'='*50}")
     print(f"Step: {name}")
     print(f"{'='*50}")
-    env = os.environ.copy()
-    if env_vars:
-        env.update(env_vars)
-    result = subprocess.run([sys.executable, script], capture_output=False, env=env)
-    if result.returncode != 0:
+    saved = {key: os.environ.get(key) for key in (env_vars or {})}
+    os.environ.update(env_vars or {})
+    try:
+        step()
+    except (Exception, SystemExit):
+        traceback.print_exc()
         print(f"Error in {name}")
         return False
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
     return True
 
 def main():
@@ -81,20 +96,20 @@ def main():
     env = {'OUTPUT_DIR': output_dir}
 
     # Step 1: Search arXiv for medical papers
-    if not run_step("Search arXiv for medical papers", "search_arxiv_medical.py", env):
+    if not run_step("Search arXiv for medical papers", search_arxiv_medical.main, env):
         return
 
     # Step 2: Extract keywords and Chinese summary using LLM
-    if not run_step("Extract paper insights with LLM", "extract_paper_insights.py", env):
+    if not run_step("Extract paper insights with LLM", extract_paper_insights.main, env):
         return
 
     # Step 3: Categorize papers
-    if not run_step("Categorize papers", "categorize_papers.py", env):
+    if not run_step("Categorize papers", categorize_papers.main, env):
         return
 
     # Step 4: Generate HTML report (shared template goes to docs root)
     report_env = {'OUTPUT_DIR': 'docs'}
-    if not run_step("Generate HTML report", "generate_html_report.py", report_env):
+    if not run_step("Generate HTML report", lambda: generate_html_report.main([]), report_env):
         return
 
     # Step 5: Clean up temporary JSON files
@@ -111,7 +126,7 @@ def main():
     print("Cleanup complete")
 
     # Step 6: Generate index page
-    if not run_step("Generate index page", "generate_index.py"):
+    if not run_step("Generate index page", lambda: generate_index.main([])):
         return
 
     print("\n" + "=" * 50)
@@ -15,6 +15,45 @@ TOPIC_RELATED_PROMPT = """判断以下论文是否与给定的主题相关，并
 }}
 """
 
+# Batched LLM filter prompt: judges several papers in one request, keyed by their integer id
+TOPIC_RELATED_BATCH_PROMPT = """判断以下每篇论文是否与给定的主题相关，并返回具体所属的主题。
+
+只判断是否属于以下给定的主题：{topics}
+
+{papers}
+
+请为每篇论文返回一条结果，id 与上面的编号一致，按照以下JSON格式返回（不要用markdown包裹，仅输出JSON字符串）：
+{{
+    "results": [
+        {{"id": 0, "related": true 或 false, "topics": ["主题1", "主题2"] 或 []}}
+    ]
+}}
+"""
+
+# Combined batch prompt: relevance judgment plus insight extraction for the related papers,
+# so kept papers need no separate EXTRACT_PAPER_INSIGHTS call
+TOPIC_RELATED_INSIGHTS_BATCH_PROMPT = """判断以下每篇论文是否与给定的主题相关，并返回具体所属的主题；对相关的论文同时提取关键词、中文总结和中文摘要。
+
+只判断是否属于以下给定的主题：{topics}
+
+{papers}
+
+请为每篇论文返回一条结果，id 与上面的编号一致。仅当 related 为 true 时填写 keywords、summary、abstract_cn，否则这三项留空字符串。
+按照以下JSON格式返回（不要用markdown包裹，仅输出JSON字符串）：
+{{
+    "results": [
+        {{
+            "id": 0,
+            "related": true 或 false,
+            "topics": ["主题1", "主题2"] 或 [],
+            "keywords": "关键词1, 关键词2, 关键词3（3-5个中文关键词，用逗号分隔）",
+            "summary": "100字以内的中文总结",
+            "abstract_cn": "将摘要翻译成中文，保留专业术语的英文并用括号标注"
+        }}
+    ]
+}}
+"""
+
 # Generate arXiv search terms based on given topics
 GENERATE_SEARCH_TERMS_PROMPT = """根据以下研究主题，生成用于 arXiv 搜索的关键词组合。
 
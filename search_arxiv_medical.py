@@ -4,22 +4,64 @@ Search for recent medical AI papers on arXiv
 Only focuses on: medical LLMs, medical datasets, medical AI agents
 """
 import arxiv
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+import hashlib
 import json
 import os
-from llm import get_llm_client
-from prompts import TOPIC_RELATED_PROMPT, GENERATE_SEARCH_TERMS_PROMPT
-from utils import save_json
+import re
+from llm import (
+    clean_markdown_code_blocks, create_json_completion, create_json_completion_async,
+    get_llm_client, get_async_llm_client,
+)
+from prompts import (
+    TOPIC_RELATED_PROMPT, TOPIC_RELATED_BATCH_PROMPT, TOPIC_RELATED_INSIGHTS_BATCH_PROMPT,
+    GENERATE_SEARCH_TERMS_PROMPT
+)
+from utils import arxiv_session, load_json, save_json
 
 # Configuration from environment variables
 DAYS_BACK = int(os.getenv('ARXIV_DAYS_BACK', 7))  # Default: last 7 days
 MAX_RESULTS_PER_TERM = int(os.getenv('ARXIV_MAX_RESULTS', 50))
+LLM_FILTER_BATCH_SIZE = int(os.getenv('LLM_FILTER_BATCH_SIZE', 16))  # Papers judged per LLM request
+LLM_CONCURRENCY = int(os.getenv('LLM_CONCURRENCY', 16))  # Max in-flight LLM requests
+# Relevance only needs the opening of the abstract; shorter prompts mean less prefill per request
+ABSTRACT_TRUNC_CHARS = int(os.getenv('ABSTRACT_TRUNC_CHARS', 800))
+TITLE_TRUNC_CHARS = 200
+# Extract keywords/summary/abstract_cn in the same request as the relevance check.
+# Needs the full abstract, and each related paper adds a translation to the reply,
+# so combined batches are kept small to stay within the output token limit.
+LLM_COMBINED_EXTRACT = os.getenv('LLM_COMBINED_EXTRACT', 'false').lower() == 'true'
+COMBINED_BATCH_SIZE = 4
+# SubmittedDate order is not strictly by published date, so a term only stops paging
+# after this many consecutive results older than the window
+OLDER_RESULTS_BEFORE_STOP = 10
 
 # Filter keywords from environment variables (comma-separated)
 FILTER_KEYWORDS_RAW = os.getenv('FILTER_KEYWORDS', '')
-FILTER_KEYWORDS = FILTER_KEYWORDS_RAW.split(',') if FILTER_KEYWORDS_RAW else []
+FILTER_KEYWORDS = [kw.strip().lower() for kw in FILTER_KEYWORDS_RAW.split(',') if kw.strip()]
+# All keywords compiled into one alternation, so each paper is scanned once instead of once per keyword
+FILTER_KEYWORDS_RE = re.compile('|'.join(map(re.escape, FILTER_KEYWORDS))) if FILTER_KEYWORDS else None
 
 GIVEN_TOPICS = os.getenv('TOPICS')
+# Topics are fixed for the run: render them into the batch prompt once and keep the
+# text on either side of the {papers} slot, so each batch is a plain concatenation
+_BATCH_PROMPT_HEAD, _, _BATCH_PROMPT_TAIL = \
+    TOPIC_RELATED_BATCH_PROMPT.format(topics=GIVEN_TOPICS, papers='\0').partition('\0')
+_COMBINED_PROMPT_HEAD, _, _COMBINED_PROMPT_TAIL = \
+    TOPIC_RELATED_INSIGHTS_BATCH_PROMPT.format(topics=GIVEN_TOPICS, papers='\0').partition('\0')
+# Reply budget per paper in a batch: the result object plus the matched topics echoed
+# back; a CJK topic costs about one token per character, so the full TOPICS string bounds it
+_VERDICT_TOKENS = 48 + len(GIVEN_TOPICS or '')
+
+# On-disk cache of LLM filter verdicts, keyed by FILTER_CACHE_VERSION and arxiv_id
+LLM_FILTER_CACHE = os.getenv('LLM_FILTER_CACHE', 'llm_filter_cache.json')
+# Verdicts only carry over while the prompts, topics and model stay the same
+FILTER_CACHE_VERSION = hashlib.blake2b('\0'.join((
+    TOPIC_RELATED_PROMPT, TOPIC_RELATED_BATCH_PROMPT, TOPIC_RELATED_INSIGHTS_BATCH_PROMPT,
+    GIVEN_TOPICS or '', os.getenv('OPENAI_MODEL', 'gpt-4o-mini'), str(ABSTRACT_TRUNC_CHARS)
+)).encode('utf-8'), digest_size=8).hexdigest()
 
 
 
@@ -34,7 +76,8 @@ def generate_search_terms(client, topics, max_retries=2):
 
     for attempt in range(max_retries):
         try:
-            response = client.chat.completions.create(
+            response = create_json_completion(
+                client,
                 model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
                 messages=[{'role': 'user', 'content': prompt}],
                 temperature=0.3
@@ -67,63 +110,20 @@ def generate_search_terms(client, topics, max_retries=2):
     raise ValueError("Failed to generate search terms from LLM")
 
 
-# Calculate date range
-force_start = os.getenv('FORCE_DATE_START')
-force_end = os.getenv('FORCE_DATE_END')
-
-if force_start and force_end:
-    # Use forced date range (from GitHub Actions)
-    start_date = datetime.strptime(force_start, '%Y-%m-%d').replace(tzinfo=timezone.utc)
-    end_date = datetime.strptime(force_end, '%Y-%m-%d').replace(hour=23, minute=59, second=59, tzinfo=timezone.utc)
-    print(f"[INFO] Using forced date range: {force_start} to {force_end}")
-else:
-    # Calculate date range dynamically (past N days, excluding today)
-    # ARXIV_DAYS_BACK=1 -> yesterday only
-    # ARXIV_DAYS_BACK=3 -> from 3 days ago to yesterday
-    now = datetime.now(timezone.utc)
-    yesterday = now - timedelta(days=1)
-    end_date = datetime(yesterday.year, yesterday.month, yesterday.day, 23, 59, 59, tzinfo=timezone.utc)
-    start_date = end_date - timedelta(days=DAYS_BACK - 1)
-    start_date = datetime(start_date.year, start_date.month, start_date.day, 0, 0, 0, tzinfo=timezone.utc)
-
-all_results = []
-seen_ids = set()  # O(1) lookup for deduplication
-
-client = arxiv.Client()
-llm_client = get_llm_client()
-
-
-def clean_markdown_code_blocks(content: str) -> str:
-    """Remove markdown code block wrappers from LLM responses."""
-    content = content.strip()
-    if content.startswith('```json'):
-        content = content[7:]
-    elif content.startswith('```'):
-        content = content[3:]
-    if content.endswith('```'):
-        content = content[:-3]
-    return content.strip()
-
-# 动态生成搜索词
-print(f"[INFO] Topics: {GIVEN_TOPICS}")
-search_terms = generate_search_terms(llm_client, GIVEN_TOPICS, max_retries=2)
-print(f"[INFO] Search terms: {search_terms}")
-
-
 def keywords_filter(title: str, summary: str) -> bool:
     """关键词初筛：检查是否包含任一配置关键词
     如果关键词列表为空，跳过初筛直接返回True
     """
-    if not FILTER_KEYWORDS:
+    if FILTER_KEYWORDS_RE is None:
         return True
     text = (title + ' ' + summary).lower()
-    return any(kw in text for kw in FILTER_KEYWORDS)
+    return FILTER_KEYWORDS_RE.search(text) is not None
 
 
-def llm_filter(client, title, abstract, max_retries=2):
+async def llm_filter(client, semaphore, title, abstract, max_retries=2):
     """
     LLM筛选：判断论文是否与TOPIC相关，并返回具体所属的主题
-    返回: (related: bool, topics: list)
+    返回: (related: bool, topics: list)，请求失败时返回 None
     """
     if not client:
         return True, []  # 没有LLM时不过滤
@@ -132,11 +132,13 @@ def llm_filter(client, title, abstract, max_retries=2):
 
     for attempt in range(max_retries):
         try:
-            response = client.chat.completions.create(
-                model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
-                messages=[{'role': 'user', 'content': prompt}],
-                temperature=0.1
-            )
+            async with semaphore:
+                response = await create_json_completion_async(
+                    client,
+                    model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
+                    messages=[{'role': 'user', 'content': prompt}],
+                    temperature=0.1
+                )
 
             if not response.choices:
                 raise ValueError("Empty response choices")
@@ -153,20 +155,171 @@ def llm_filter(client, title, abstract, max_retries=2):
                 topics = result.get('topics', [])
                 return related, topics
             except json.JSONDecodeError as e:
+                # 无法解析时不猜测结果（猜测会被当作真实判断写入缓存），按出错重试
                 print(f"[WARN] Failed to parse LLM response: {e}, content: {content[:100]}")
-                # 回退到简单判断
-                return content.lower().startswith('yes'), []
+                raise
 
         except Exception as e:
             if attempt < max_retries - 1:
                 continue
             print(f"[WARN] LLM filter failed: {e}")
-            return True, []  # 出错时保留
+            return None  # 出错：由调用方保留，且不写入缓存
+
+    return None
+
+
+async def llm_filter_batch(client, semaphore, papers, max_retries=2):
+    """
+    批量LLM筛选：一次请求判断多篇论文，摊薄每次调用的网络与首字延迟
+    papers: list of {"title": ..., "abstract": ...}
+    返回: list of (related: bool, topics: list) 或 None（失败/缺失），与 papers 一一对应
+    """
+    if not client:
+        return [(True, [])] * len(papers)  # 没有LLM时不过滤
+    if len(papers) == 1:
+        return [await llm_filter(client, semaphore, papers[0]['title'], papers[0]['abstract'], max_retries)]
 
-    return True, []
+    papers_text = '\n\n'.join(
+        f"[{i}] 论文标题：{p['title']}\n论文摘要：{p['abstract']}" for i, p in enumerate(papers)
+    )
+    prompt = _BATCH_PROMPT_HEAD + papers_text + _BATCH_PROMPT_TAIL
 
+    for attempt in range(max_retries):
+        try:
+            async with semaphore:
+                response = await create_json_completion_async(
+                    client,
+                    model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
+                    messages=[{'role': 'user', 'content': prompt}],
+                    temperature=0.1,
+                    max_tokens=64 + _VERDICT_TOKENS * len(papers)  # Room for one result object per paper
+                )
 
-for term in search_terms:
+            if not response.choices:
+                raise ValueError("Empty response choices")
+            if response.choices[0].finish_reason == 'length':
+                # The same prompt would be cut off again: leave these papers to the per-paper fallback
+                print(f"[WARN] LLM batch filter reply hit max_tokens ({len(papers)} papers)")
+                break
+
+            content = response.choices[0].message.content.strip()
+            result = json.loads(clean_markdown_code_blocks(content))
+
+            # 缺失或无法识别的条目按出错处理
+            verdicts = [None] * len(papers)
+            for item in result.get('results', []):
+                idx = item.get('id')
+                if isinstance(idx, int) and 0 <= idx < len(papers):
+                    verdicts[idx] = (item.get('related', False), item.get('topics', []))
+            return verdicts
+
+        except Exception as e:
+            if attempt < max_retries - 1:
+                continue
+            print(f"[WARN] LLM batch filter failed: {e}")
+
+    return [None] * len(papers)
+
+
+async def llm_filter_extract_batch(client, semaphore, papers, max_retries=2):
+    """
+    合并模式：一次请求完成筛选，并为相关论文提取关键词、中文总结和中文摘要
+    papers: list of {"title": ..., "abstract": ...}（摘要不截断，翻译需要全文）
+    返回: list of ((related, topics), insights) 或 None（失败/缺失），与 papers 一一对应
+        insights: {"llm_keywords", "llm_summary", "abstract_cn"}，不相关时为 None
+    """
+    papers_text = '\n\n'.join(
+        f"[{i}] 论文标题：{p['title']}\n论文摘要：{p['abstract']}" for i, p in enumerate(papers)
+    )
+    prompt = _COMBINED_PROMPT_HEAD + papers_text + _COMBINED_PROMPT_TAIL
+
+    for attempt in range(max_retries):
+        try:
+            async with semaphore:
+                response = await create_json_completion_async(
+                    client,
+                    model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
+                    messages=[{'role': 'user', 'content': prompt}],
+                    temperature=0.3,
+                    # A verdict and a translated abstract may come back for every paper
+                    max_tokens=64 + (800 + _VERDICT_TOKENS) * len(papers)
+                )
+
+            if not response.choices:
+                raise ValueError("Empty response choices")
+            if response.choices[0].finish_reason == 'length':
+                # The same prompt would be cut off again: leave these papers to the per-paper fallback
+                print(f"[WARN] LLM combined filter reply hit max_tokens ({len(papers)} papers)")
+                break
+
+            content = response.choices[0].message.content.strip()
+            result = json.loads(clean_markdown_code_blocks(content))
+
+            # 缺失或无法识别的条目按出错处理
+            outcomes = [None] * len(papers)
+            for item in result.get('results', []):
+                idx = item.get('id')
+                if isinstance(idx, int) and 0 <= idx < len(papers):
+                    related = item.get('related', False)
+                    insights = {
+                        'llm_keywords': item.get('keywords') or None,
+                        'llm_summary': item.get('summary') or None,
+                        'abstract_cn': item.get('abstract_cn') or None,
+                    } if related else None
+                    outcomes[idx] = ((related, item.get('topics', [])), insights)
+            return outcomes
+
+        except Exception as e:
+            if attempt < max_retries - 1:
+                continue
+            print(f"[WARN] LLM combined filter failed: {e}")
+
+    return [None] * len(papers)
+
+
+def is_verdict(value):
+    """缓存中的筛选结果须为 (related: bool, topics: list)，JSON 中存为两项列表"""
+    return (isinstance(value, (list, tuple)) and len(value) == 2
+            and isinstance(value[0], bool) and isinstance(value[1], list))
+
+
+def save_filter_cache(cache, keys):
+    """原子写入筛选缓存，只保留 keys 中的条目（当前版本、本次检索到的论文）"""
+    current = {key: value for key, value in cache.items() if key in keys}
+    tmp_path = LLM_FILTER_CACHE + '.tmp'
+    if save_json(tmp_path, current):
+        os.replace(tmp_path, LLM_FILTER_CACHE)
+
+
+def get_date_range():
+    """计算检索日期范围
+    返回: (start_date, end_date)，均为 UTC
+    """
+    force_start = os.getenv('FORCE_DATE_START')
+    force_end = os.getenv('FORCE_DATE_END')
+
+    if force_start and force_end:
+        # Use forced date range (from GitHub Actions)
+        start_date = datetime.strptime(force_start, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        end_date = datetime.strptime(force_end, '%Y-%m-%d').replace(hour=23, minute=59, second=59, tzinfo=timezone.utc)
+        print(f"[INFO] Using forced date range: {force_start} to {force_end}")
+    else:
+        # Calculate date range dynamically (past N days, excluding today)
+        # ARXIV_DAYS_BACK=1 -> yesterday only
+        # ARXIV_DAYS_BACK=3 -> from 3 days ago to yesterday
+        now = datetime.now(timezone.utc)
+        yesterday = now - timedelta(days=1)
+        end_date = datetime(yesterday.year, yesterday.month, yesterday.day, 23, 59, 59, tzinfo=timezone.utc)
+        start_date = end_date - timedelta(days=DAYS_BACK - 1)
+        start_date = datetime(start_date.year, start_date.month, start_date.day, 0, 0, 0, tzinfo=timezone.utc)
+
+    return start_date, end_date
+
+
+def fetch_term(term, start_date, end_date):
+    """检索单个搜索词，返回通过日期与关键词初筛的候选论文
+    返回: list of arxiv.Result
+    """
     print(f"Searching for: {term}")
 
     # Combine search term with medical keyword filter
@@ -178,63 +331,226 @@ for term in search_terms:
         sort_by=arxiv.SortCriterion.SubmittedDate
     )
 
+    candidates = []
+
+    # One page sized to the result limit: the default 100-entry page would download
+    # entries beyond max_results that are then discarded
     try:
-        for result in client.results(search):
-            published = result.published
-            category = result.primary_category
+        with arxiv_session(page_size=min(max(MAX_RESULTS_PER_TERM, 1), 2000)) as client:
+            older_run = 0
+            for result in client.results(search):
+                # Filter by date range. Results come roughly newest first (SubmittedDate):
+                # once a run of papers all predate start_date, the rest are older too,
+                # so stop instead of paging through them.
+                published = result.published
+                if published < start_date:
+                    older_run += 1
+                    if older_run >= OLDER_RESULTS_BEFORE_STOP:
+                        break
+                    continue
+                older_run = 0
+                if published > end_date:
+                    continue
+
+                # 关键词初筛
+                if not keywords_filter(result.title, result.summary):
+                    continue
+
+                candidates.append(result)
 
-            # Filter by date range
-            if not (start_date <= published <= end_date):
-                continue
+    except Exception as e:
+        # 重试用尽仍失败：保留已取得的结果，但明确提示该搜索词不完整
+        print(f"[WARN] Error searching {term} ({len(candidates)} papers kept, results incomplete): {e}")
 
-            # 关键词初筛
-            if not keywords_filter(result.title, result.summary):
-                continue
+    return candidates
 
-            # LLM二次筛选：判断是否与医疗大模型/数据集/智能体相关
-            related, topics = llm_filter(llm_client, result.title, result.summary)
-            if not related:
-                continue
 
-            paper_info = {
-                "title": result.title,
-                "authors": [str(a) for a in result.authors],
-                "published": published.strftime("%Y-%m-%d"),
-                "summary": result.summary[:500],
-                "pdf_url": result.pdf_url,
-                "primary_category": category,
-                "topics": topics  # LLM返回的所属主题列表
-            }
-
-            # Extract arxiv ID from entry_id
-            arxiv_id = result.entry_id.split("/")[-1] if "/" in result.entry_id else result.entry_id
-            paper_info["arxiv_id"] = arxiv_id
-
-            if arxiv_id not in seen_ids:
-                seen_ids.add(arxiv_id)
-                all_results.append(paper_info)
-                print(f"  Found: {arxiv_id} - {paper_info['title'][:60]}...")
+async def search_and_filter(search_terms, start_date, end_date):
+    """检索所有搜索词并做LLM二次筛选，两者重叠进行
 
-    except Exception as e:
-        print(f"  Error searching {term}: {e}")
-
-# Sort by date (most recent first)
-all_results.sort(key=lambda x: x["published"], reverse=True)
-
-# Save results with date range metadata
-output_dir = os.getenv('OUTPUT_DIR', '.')
-os.makedirs(output_dir, exist_ok=True)
-output_file = os.path.join(output_dir, "relative_papers.json")
-output_data = {
-    "papers": all_results,
-    "date_range": {
-        "start_date": start_date.strftime("%Y-%m-%d"),
-        "end_date": end_date.strftime("%Y-%m-%d")
+    搜索词在后台线程中依次检索；某个搜索词一返回，其候选论文就去重、查缓存，
+    未命中的立即分批提交LLM，同时其余搜索词仍在检索中。
+    返回: (candidates, verdicts, insights)
+        candidates: list of (arxiv_id, arxiv.Result)，按发表时间倒序
+        verdicts: list of (related: bool, topics: list)，与 candidates 一一对应
+        insights: dict of arxiv_id -> 提取结果（仅 LLM_COMBINED_EXTRACT 模式下的相关论文）
+    """
+    loop = asyncio.get_running_loop()
+    client = get_async_llm_client()  # 没有LLM时不过滤
+    semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+
+    # 重叠的检索窗口会反复遇到同一篇论文，已判断过的直接复用
+    cache = load_json(LLM_FILTER_CACHE, {}) if client else {}
+    if not isinstance(cache, dict):
+        cache = {}
+    # 格式不对的条目（手工编辑、旧版本写入）丢弃，让论文重新判断
+    cache = {key: verdict for key, verdict in cache.items() if is_verdict(verdict)}
+
+    candidates = []
+    seen_ids = set()  # O(1) lookup for deduplication
+    verdicts = {}  # arxiv_id -> (related, topics), or None if the LLM call failed
+    insights = {}  # arxiv_id -> extracted fields, combined mode only
+    batch_size = COMBINED_BATCH_SIZE if LLM_COMBINED_EXTRACT else LLM_FILTER_BATCH_SIZE
+    pending = []  # Cache misses not yet sent to the LLM
+    tasks = []
+    miss_count = 0
+
+    async def judge(batch):
+        if LLM_COMBINED_EXTRACT:
+            outcomes = await llm_filter_extract_batch(client, semaphore, [
+                {'title': result.title, 'abstract': result.summary} for _, result in batch
+            ])
+            results = []
+            for (arxiv_id, _), outcome in zip(batch, outcomes):
+                verdict, extracted = outcome if outcome is not None else (None, None)
+                if extracted:
+                    insights[arxiv_id] = extracted
+                results.append(verdict)
+        else:
+            results = await llm_filter_batch(client, semaphore, [
+                {'title': result.title[:TITLE_TRUNC_CHARS], 'abstract': result.summary[:ABSTRACT_TRUNC_CHARS]}
+                for _, result in batch
+            ])
+        # 批量请求失败、被截断或漏掉的论文逐篇重判，而不是不经筛选直接保留
+        # （单篇的筛选批次本身已走 llm_filter）
+        missing = [i for i, verdict in enumerate(results) if verdict is None]
+        if missing and (LLM_COMBINED_EXTRACT or len(batch) > 1):
+            print(f"[INFO] Re-judging {len(missing)} of {len(batch)} papers one by one")
+            retried = await asyncio.gather(*(
+                llm_filter(client, semaphore, batch[i][1].title[:TITLE_TRUNC_CHARS],
+                           batch[i][1].summary[:ABSTRACT_TRUNC_CHARS])
+                for i in missing
+            ))
+            for i, verdict in zip(missing, retried):
+                results[i] = verdict
+
+        for (arxiv_id, _), verdict in zip(batch, results):
+            verdicts[arxiv_id] = verdict
+            if is_verdict(verdict):
+                cache[f'{FILTER_CACHE_VERSION}:{arxiv_id}'] = verdict
+
+    def dispatch(flush=False):
+        # Batch papers of similar abstract length together, so no request is held up by one long outlier.
+        # Filter mode only sends the truncated abstract, so sort by what is actually sent.
+        if LLM_COMBINED_EXTRACT:
+            pending.sort(key=lambda c: len(c[1].summary))
+        else:
+            pending.sort(key=lambda c: min(len(c[1].summary), ABSTRACT_TRUNC_CHARS))
+        size = len(pending) if flush else len(pending) - len(pending) % batch_size
+        for i in range(0, size, batch_size):
+            tasks.append(asyncio.create_task(judge(pending[i:min(i + batch_size, size)])))
+        del pending[:size]
+
+    try:
+        # arXiv allows one request every 3 seconds and fetch_term holds the shared
+        # client for a whole term, so one fetch thread is enough; the event loop
+        # keeps judging batches of finished terms in the meantime
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            fetches = [
+                loop.run_in_executor(executor, fetch_term, term, start_date, end_date)
+                for term in search_terms
+            ]
+            for fetch in asyncio.as_completed(fetches):
+                # Merged on the event loop thread, so the dedup set needs no lock,
+                # and a paper returned by several terms is sent to the LLM only once
+                for result in await fetch:
+                    # Extract arxiv ID from entry_id (rfind returns -1 when there is no "/")
+                    entry_id = result.entry_id
+                    arxiv_id = entry_id[entry_id.rfind('/') + 1:]
+                    if arxiv_id in seen_ids:
+                        continue
+                    seen_ids.add(arxiv_id)
+                    candidates.append((arxiv_id, result))
+
+                    if not client:
+                        continue
+                    verdict = cache.get(f'{FILTER_CACHE_VERSION}:{arxiv_id}')
+                    if verdict is None:
+                        pending.append((arxiv_id, result))
+                        miss_count += 1
+                    else:
+                        verdicts[arxiv_id] = verdict
+                dispatch()
+
+        if client:
+            dispatch(flush=True)
+            print(f"[INFO] LLM filter: {len(candidates)} candidates, "
+                  f"{len(candidates) - miss_count} cached, {miss_count} sent to LLM")
+            await asyncio.gather(*tasks)
+    finally:
+        if client:
+            await client.close()
+
+    if client and seen_ids:
+        # 只保留本次检索窗口内论文的判断：窗口之外的论文不会再被查到，缓存不会无限增长
+        # （检索全部失败时 seen_ids 为空，此时保留原缓存）
+        keys = {f'{FILTER_CACHE_VERSION}:{arxiv_id}' for arxiv_id in seen_ids}
+        if miss_count or cache.keys() - keys:
+            save_filter_cache(cache, keys)
+
+    # Sort by date (most recent first). Each term's results already arrive in
+    # SubmittedDate order, so this is a merge of a few presorted runs for timsort,
+    # and the papers kept in main() stay in order without another sort.
+    candidates.sort(key=lambda c: (c[1].published, c[0]), reverse=True)
+
+    # 出错时保留
+    results = [verdicts.get(arxiv_id) for arxiv_id, _ in candidates]
+    return candidates, [verdict if verdict is not None else (True, []) for verdict in results], insights
+
+
+def main():
+    start_date, end_date = get_date_range()
+
+    llm_client = get_llm_client()
+
+    # 动态生成搜索词
+    print(f"[INFO] Topics: {GIVEN_TOPICS}")
+    search_terms = generate_search_terms(llm_client, GIVEN_TOPICS, max_retries=2)
+    print(f"[INFO] Search terms: {search_terms}")
+
+    # 检索与LLM二次筛选（是否与医疗大模型/数据集/智能体相关）重叠进行
+    candidates, verdicts, insights = asyncio.run(search_and_filter(search_terms, start_date, end_date))
+
+    all_results = []
+
+    for (arxiv_id, result), (related, topics) in zip(candidates, verdicts):
+        if not related:
+            continue
+
+        paper_info = {
+            "title": result.title,
+            "authors": [a.name for a in result.authors],
+            "published": result.published.strftime("%Y-%m-%d"),
+            "summary": result.summary[:500],
+            "abstract": result.summary,  # Full abstract, so the extract step need not refetch it
+            "pdf_url": result.pdf_url,
+            "primary_category": result.primary_category,
+            "topics": topics,  # LLM返回的所属主题列表
+            "arxiv_id": arxiv_id
+        }
+        # 合并模式下已提取的字段，提取步骤会跳过这些论文
+        paper_info.update(insights.get(arxiv_id, {}))
+        all_results.append(paper_info)
+        print(f"  Found: {arxiv_id} - {paper_info['title'][:60]}...")
+
+    # Save results with date range metadata
+    output_dir = os.getenv('OUTPUT_DIR', '.')
+    os.makedirs(output_dir, exist_ok=True)
+    output_file = os.path.join(output_dir, "relative_papers.json")
+    output_data = {
+        "papers": all_results,
+        "date_range": {
+            "start_date": start_date.strftime("%Y-%m-%d"),
+            "end_date": end_date.strftime("%Y-%m-%d")
+        }
     }
-}
-save_json(output_file, output_data)
+    save_json(output_file, output_data)
+
+    print(f"\n=== Summary ===")
+    print(f"Total unique papers found: {len(all_results)}")
+    print(f"Date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+    print(f"Results saved to: {output_file}")
+
 
-print(f"\n=== Summary ===")
-print(f"Total unique papers found: {len(all_results)}")
-print(f"Date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
-print(f"Results saved to: {output_file}")
+if __name__ == '__main__':
+    main()
@@ -2,9 +2,27 @@
 """Shared utility functions for the arXiv paper pipeline."""
 import json
 import os
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+# orjson is an optional faster parser/serializer; stdlib json also accepts bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dump_bytes(data: Any) -> bytes:
+        # Non-ASCII is written as-is and non-str keys are stringified, matching
+        # json.dump(ensure_ascii=False, indent=2) below
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dump_bytes(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
 
 def load_json(filepath: str, default: Optional[Any] = None) -> Any:
     """Load JSON from file with error handling.
@@ -17,8 +35,9 @@ def load_json(filepath: str, default: Optional[Any] = None) -> Any:
         Parsed JSON data or default value
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # Read the raw bytes in one call; the parser decodes UTF-8 itself
+        with open(filepath, 'rb') as f:
+            return _json_loads(f.read())
     except (FileNotFoundError, json.JSONDecodeError, IOError):
         return default
 
@@ -36,14 +55,55 @@ def save_json(filepath: str, data: Any) -> bool:
     try:
         # Ensure parent directory exists
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        payload = _json_dump_bytes(data)
+        with open(filepath, 'wb') as f:
+            f.write(payload)
         return True
     except (IOError, OSError) as e:
         print(f"[WARN] Failed to save JSON to {filepath}: {e}")
         return False
 
 
+@lru_cache(maxsize=None)
+def get_arxiv_client():
+    """Get the process-wide arxiv.Client.
+
+    The client is kept for the life of the process, so pipeline steps running
+    in-process reuse the same HTTP session (keep-alive connections). Use it
+    through arxiv_session() so concurrent callers respect the rate limit; the
+    page size is set there per use rather than fixed here.
+
+    Returns:
+        arxiv.Client instance
+    """
+    import arxiv
+    return arxiv.Client(delay_seconds=3, num_retries=5)
+
+
+# arXiv asks for at most one request every 3 seconds from a caller; the client
+# only spaces out its own requests, so all threads share one client behind this lock
+_ARXIV_LOCK = threading.Lock()
+
+
+@contextmanager
+def arxiv_session(page_size: int = 100):
+    """Borrow the shared arxiv.Client exclusively.
+
+    The lock is held for the whole ``with`` block, so iterate the results
+    inside it.
+
+    Args:
+        page_size: Results requested per API call (arXiv allows up to 2000)
+
+    Yields:
+        arxiv.Client instance
+    """
+    with _ARXIV_LOCK:
+        client = get_arxiv_client()
+        client.page_size = page_size
+        yield client
+
+
 def get_data_path(filename: str) -> str:
     """Get full path for a data file in OUTPUT_DIR.
 
@@ -66,3 +126,42 @@ def ensure_output_dir() -> str:
     output_dir = os.getenv('OUTPUT_DIR', '.')
     os.makedirs(output_dir, exist_ok=True)
     return output_dir
+
+
+# The docs/YYYY/MM/DD walk shared by generate_index.py and extract_legacy_data.py.
+# os.scandir's DirEntry objects carry the file type from the directory read (no
+# extra stat per entry), and names are checked before is_dir(), so stray files such
+# as index.html or .nojekyll are rejected without touching the entry type at all.
+# Entries come in directory order; callers sort once.
+def iter_year_dirs(docs_dir: str = 'docs'):
+    """Yield docs/YYYY directory entries.
+
+    Args:
+        docs_dir: Root of the published reports
+
+    Yields:
+        os.DirEntry for each year directory
+    """
+    with os.scandir(docs_dir) as it:
+        for entry in it:
+            if entry.name.isdigit() and entry.is_dir():
+                yield entry
+
+
+def iter_day_dirs(year_entry: os.DirEntry):
+    """Yield every docs/YYYY/MM/DD[-N] directory in a year.
+
+    Args:
+        year_entry: Year directory entry from iter_year_dirs()
+
+    Yields:
+        (month, day_entry) tuples
+    """
+    with os.scandir(year_entry.path) as months:
+        for month_entry in months:
+            if not month_entry.name.isdigit() or not month_entry.is_dir():
+                continue
+            with os.scandir(month_entry.path) as days:
+                for day_entry in days:
+                    if day_entry.name.split('-')[0].isdigit() and day_entry.is_dir():
+                        yield month_entry.name, day_entry